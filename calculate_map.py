@@ -1,6 +1,7 @@
 import pydirectinput
 import time
 import os
+import json
 
 def clear():
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -84,5 +85,12 @@ sp_h = sp_bottom - sp_top
 print(f"MINIMAP_REGION = {{'top': {mm_top}, 'left': {mm_left}, 'width': {mm_w}, 'height': {mm_h}}}")
 print(f"HP_REGION = {{'top': {hp_top}, 'left': {hp_left}, 'width': {hp_w}, 'height': {hp_h}}}")
 print(f"SP_REGION = {{'top': {sp_top}, 'left': {sp_left}, 'width': {sp_w}, 'height': {sp_h}}}")
+
+# script.py loads this on startup instead of its 1366x768 defaults
+with open("hud_calibration.json", 'w') as f:
+    json.dump({'MINIMAP_REGION': {'top': mm_top, 'left': mm_left, 'width': mm_w, 'height': mm_h},
+               'HP_REGION': {'top': hp_top, 'left': hp_left, 'width': hp_w, 'height': hp_h},
+               'SP_REGION': {'top': sp_top, 'left': sp_left, 'width': sp_w, 'height': sp_h}}, f, indent=2)
+print("Saved to hud_calibration.json")
 print("=================================================")
 input("Press Enter to exit...")
\ No newline at end of file
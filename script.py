@@ -8,31 +8,98 @@ import keyboard
 import random
 import os
 import csv
+import json
 from collections import deque
 from datetime import datetime
 
-# Screen zones - Need to adjust these if I change resolution
-MINIMAP_REGION = {'top': 45, 'left': 901, 'width': 114, 'height': 114}
-HP_REGION = {'top': 768, 'left': 59, 'width': 99, 'height': 11}
-SP_REGION = {'top': 781, 'left': 60, 'width': 98, 'height': 9}
-ITEM_SEARCH_REGION = {'top': 200, 'left': 200, 'width': 800, 'height': 400}
-SCREEN_WIDTH = 1366 
-SCREEN_HEIGHT = 768
-DAMAGE_REGION = {'top': (SCREEN_HEIGHT // 2) - 150, 'left': (SCREEN_WIDTH // 2) - 100, 'width': 200, 'height': 200}
+# Screen zones - Defined for the 1366x768 reference client, scaled below to the real resolution
+BASE_WIDTH = 1366
+BASE_HEIGHT = 768
+
+def get_screen_size():
+    # Primary monitor, the game runs fullscreen on it
+    with mss.mss() as sct:
+        mon = sct.monitors[1]
+    return mon['width'], mon['height']
+
+SCREEN_WIDTH, SCREEN_HEIGHT = get_screen_size()
+
+# How many times the mob name frame gets halved before thresholding. 0 = full res, 1 = 1/2, 2 = 1/4
+# Plain pixel skipping, a blurred downscale (pyrDown/resize) drops thin red names under S>=180.
+# 1 keeps ~all names and cuts ~1/3 of the vision cost, 2 loses short names so don't use it
+PYR_LEVELS = 0
+
+# HUD regions come from calculate_map.py, these are the 1366x768 calibration used as fallback
+CALIBRATION_FILE = "hud_calibration.json"
+BASE_MINIMAP_SIZE = 114
+
+def load_hud_regions():
+    regions = {'MINIMAP_REGION': {'top': 45, 'left': 901, 'width': 114, 'height': 114},
+               'HP_REGION': {'top': 768, 'left': 59, 'width': 99, 'height': 11},
+               'SP_REGION': {'top': 781, 'left': 60, 'width': 98, 'height': 9}}
+    if os.path.exists(CALIBRATION_FILE):
+        with open(CALIBRATION_FILE) as f:
+            regions.update(json.load(f))
+    return regions
+
+RES_SCALE_X = SCREEN_WIDTH / BASE_WIDTH
+RES_SCALE_Y = SCREEN_HEIGHT / BASE_HEIGHT
+RES_SCALE = math.sqrt(RES_SCALE_X * RES_SCALE_Y) # For distances/radii, keeps areas right on non 16:9
+PYR_FACTOR = 2 ** PYR_LEVELS # Processed pixel -> screen pixel
+
+def scale_px(value, factor=RES_SCALE):
+    # Reference pixels -> pixels at current resolution
+    return max(1, int(round(value * factor)))
+
+def scale_region(region):
+    # 3D world zones stretch with the screen
+    return {'top': int(round(region['top'] * RES_SCALE_Y)),
+            'left': int(round(region['left'] * RES_SCALE_X)),
+            'width': max(1, int(round(region['width'] * RES_SCALE_X))),
+            'height': max(1, int(round(region['height'] * RES_SCALE_Y)))}
+
+HUD_REGIONS = load_hud_regions()
+MINIMAP_REGION = HUD_REGIONS['MINIMAP_REGION']
+HP_REGION = HUD_REGIONS['HP_REGION']
+SP_REGION = HUD_REGIONS['SP_REGION']
+
+# UI (HUD and text labels) keeps its pixel size whatever the resolution, only the client's UI scale
+# option changes it, so measure it from the calibrated minimap
+HUD_SCALE = (MINIMAP_REGION['width'] + MINIMAP_REGION['height']) / (2 * BASE_MINIMAP_SIZE)
+
+ITEM_SEARCH_REGION = scale_region({'top': 200, 'left': 200, 'width': 800, 'height': 400})
+DAMAGE_REGION = scale_region({'top': (BASE_HEIGHT // 2) - 150, 'left': (BASE_WIDTH // 2) - 100, 'width': 200, 'height': 200})
 
 # Center vision area, ignoring UI elements on corners
-VISION_3D_REGION = {'top': 100, 'left': 150, 'width': 1066, 'height': 500}
+VISION_3D_REGION = scale_region({'top': 100, 'left': 150, 'width': 1066, 'height': 500})
 
-# ranges
-MAP_ATTACK_RANGE = 45       
-MAP_COMBAT_RANGE = 12       
-MAP_ANCHOR_RANGE = 6        
+# ranges - minimap ones are in minimap pixels, so they follow the HUD
+MAP_ATTACK_RANGE = scale_px(45, HUD_SCALE)       
+MAP_COMBAT_RANGE = scale_px(12, HUD_SCALE)       
+MAP_ANCHOR_RANGE = scale_px(6, HUD_SCALE)        
+MAP_DEADZONE = scale_px(5, HUD_SCALE) # Don't steer for tiny offsets
 
 # Screen pixel ranges for CV
-SCREEN_COMBAT_RANGE = 80  
-SCREEN_ANCHOR_RANGE = 35  
-
-PLAYER_MASK_RADIUS = 7  
+SCREEN_COMBAT_RANGE = scale_px(80)  
+SCREEN_ANCHOR_RANGE = scale_px(35)  
+SCREEN_DEADZONE = scale_px(5)
+
+PLAYER_MASK_RADIUS = scale_px(7, HUD_SCALE)  
+BLACKLIST_RADIUS = scale_px(15, HUD_SCALE)
+# Minimap dot merging and noise floor
+MINIMAP_DILATE_ITER = scale_px(2, HUD_SCALE)
+MINIMAP_MIN_AREA = 1 * HUD_SCALE ** 2
+
+# Mob name blob area limits, names are UI text so reference px^2 -> HUD px^2 -> processed px^2
+MOB_NAME_MIN_AREA = 50 * (HUD_SCALE / PYR_FACTOR) ** 2
+MOB_NAME_MAX_AREA = 3000 * (HUD_SCALE / PYR_FACTOR) ** 2
+# Horizontal dilate to join letters, shrinks with the processed frame
+MOB_NAME_KERNEL = np.ones((max(1, int(round(2 * HUD_SCALE / PYR_FACTOR))),
+                           max(1, int(round(10 * HUD_SCALE / PYR_FACTOR)))), np.uint8)
+
+# Dark item label / yellow damage pixel counts, UI text at full res
+ITEM_TEXT_MIN_PIXELS = 150 * HUD_SCALE ** 2
+DAMAGE_MIN_PIXELS = 5 * HUD_SCALE ** 2
 
 # Color filters (HSV)
 # Minimap red dots
@@ -151,7 +218,7 @@ class MobBlacklist:
         
         for zone in self.ignored_zones:
             dist = math.sqrt((target_dx - zone['dx'])**2 + (target_dy - zone['dy'])**2)
-            if dist < 15: return True # Ignore radius
+            if dist < BLACKLIST_RADIUS: return True # Ignore radius
         return False
 
 class GameLogger:
@@ -187,6 +254,12 @@ class GameState:
         hp_variance = np.var(self.hp_history) if len(self.hp_history) > 5 else 0
         return hp_variance
 
+def grab_decimated(sct, region):
+    # Keep every PYR_FACTOR-th pixel, colors stay untouched so the HSV filters still match
+    img = np.array(sct.grab(region))
+    if PYR_FACTOR == 1: return img
+    return np.ascontiguousarray(img[::PYR_FACTOR, ::PYR_FACTOR])
+
 def press_key_safe(key):
     pydirectinput.keyDown(key)
     time.sleep(0.05) 
@@ -257,7 +330,7 @@ def get_map_target(sct, blacklist):
     
     # Remove player arrow from mask minimap
     cv2.circle(mask_red, (mini_cx, mini_cy), PLAYER_MASK_RADIUS, 0, -1)
-    mask_red = cv2.dilate(mask_red, None, iterations=2)
+    mask_red = cv2.dilate(mask_red, None, iterations=MINIMAP_DILATE_ITER)
     
     contours, _ = cv2.findContours(mask_red, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
     closest_dx, closest_dy = 0, 0
@@ -265,7 +338,7 @@ def get_map_target(sct, blacklist):
     found = False
     
     for cnt in contours:
-        if cv2.contourArea(cnt) < 1: continue
+        if cv2.contourArea(cnt) < MINIMAP_MIN_AREA: continue
         M = cv2.moments(cnt)
         if M["m00"] != 0:
             cx = int(M["m10"] / M["m00"])
@@ -288,7 +361,7 @@ def get_map_target(sct, blacklist):
 
 def get_screen_target(sct):
     # 3D vision logic for ffinding mob names
-    img = np.array(sct.grab(VISION_3D_REGION))
+    img = grab_decimated(sct, VISION_3D_REGION)
     hsv = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
     hsv = cv2.cvtColor(hsv, cv2.COLOR_BGR2HSV)
     
@@ -298,8 +371,7 @@ def get_screen_target(sct):
     mask = mask1 + mask2
     
     # Dilate horizontally to connect letters into a single blob
-    kernel = np.ones((2, 10), np.uint8) 
-    mask = cv2.dilate(mask, kernel, iterations=1)
+    mask = cv2.dilate(mask, MOB_NAME_KERNEL, iterations=1)
     
     contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     
@@ -312,11 +384,12 @@ def get_screen_target(sct):
     
     for cnt in contours:
         area = cv2.contourArea(cnt)
-        if area < 50 or area > 3000: continue
+        if area < MOB_NAME_MIN_AREA or area > MOB_NAME_MAX_AREA: continue
         
+        # Remap processed frame coords back to screen pixels
         x, y, w, h = cv2.boundingRect(cnt)
-        blob_cx = x + w // 2
-        blob_cy = y + h # Bottom of text is roughly where mob feet are
+        blob_cx = (x * 2 + w) * PYR_FACTOR // 2
+        blob_cy = (y + h) * PYR_FACTOR # Bottom of text is roughly where mob feet are
         
         dx = blob_cx - center_x
         dy = blob_cy - center_y
@@ -337,7 +410,7 @@ def detect_damage_numbers(sct_img):
     hsv = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
     hsv = cv2.cvtColor(hsv, cv2.COLOR_BGR2HSV)
     mask = cv2.inRange(hsv, lower_yellow, upper_yellow)
-    return cv2.countNonZero(mask) > 5
+    return cv2.countNonZero(mask) > DAMAGE_MIN_PIXELS
 
 def manage_pickup(sct, force=False):
     global pickup_timer
@@ -354,7 +427,7 @@ def manage_pickup(sct, force=False):
         hsv = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
         hsv = cv2.cvtColor(hsv, cv2.COLOR_BGR2HSV)
         mask = cv2.inRange(hsv, lower_text, upper_text)
-        if cv2.countNonZero(mask) > 150: 
+        if cv2.countNonZero(mask) > ITEM_TEXT_MIN_PIXELS: 
             if random.random() < 0.2: press_key_safe('z')
     except: pass
 
@@ -419,12 +492,14 @@ def process_bot():
                     final_dist = scr_dist
                     combat_range = SCREEN_COMBAT_RANGE
                     anchor_range = SCREEN_ANCHOR_RANGE
+                    deadzone = SCREEN_DEADZONE
                 elif map_dist < 9000:
                     target_source = "MAPA"
                     final_dx, final_dy = map_dx, map_dy
                     final_dist = map_dist
                     combat_range = MAP_COMBAT_RANGE
                     anchor_range = MAP_ANCHOR_RANGE
+                    deadzone = MAP_DEADZONE
                 
                 # 2. Stats & Status
                 real_hp = state_manager.sanitize_hp(hp_pct)
@@ -465,10 +540,10 @@ def process_bot():
                     intended_keys = []
                     if final_dist < anchor_range: intended_keys.append('space')
                     else:
-                        if final_dy < -5: intended_keys.append('w')
-                        elif final_dy > 5: intended_keys.append('s')
-                        if final_dx < -5: intended_keys.append('a')
-                        elif final_dx > 5: intended_keys.append('d')
+                        if final_dy < -deadzone: intended_keys.append('w')
+                        elif final_dy > deadzone: intended_keys.append('s')
+                        if final_dx < -deadzone: intended_keys.append('a')
+                        elif final_dx > deadzone: intended_keys.append('d')
                         if final_dist <= combat_range: intended_keys.append('space')
                     
                     active_keys = move_mem.activate_correction(intended_keys)
@@ -520,17 +595,17 @@ def process_bot():
                              current_action_label = f"COMBAT ({target_source})"
                              if is_attacking: active_keys.append('space')
                              
-                             if final_dy < -5: active_keys.append('w')
-                             elif final_dy > 5: active_keys.append('s')
-                             if final_dx < -5: active_keys.append('a')
-                             elif final_dx > 5: active_keys.append('d')
+                             if final_dy < -deadzone: active_keys.append('w')
+                             elif final_dy > deadzone: active_keys.append('s')
+                             if final_dx < -deadzone: active_keys.append('a')
+                             elif final_dx > deadzone: active_keys.append('d')
                         else:
                              is_attacking = False
                              current_action_label = f"CHASING ({target_source})"
-                             if final_dy < -5: active_keys.append('w')
-                             elif final_dy > 5: active_keys.append('s')
-                             if final_dx < -5: active_keys.append('a')
-                             elif final_dx > 5: active_keys.append('d')
+                             if final_dy < -deadzone: active_keys.append('w')
+                             elif final_dy > deadzone: active_keys.append('s')
+                             if final_dx < -deadzone: active_keys.append('a')
+                             elif final_dx > deadzone: active_keys.append('d')
 
                 else: 
                     is_attacking = False